@@ -1,2 +1,30 @@
+# Standard Library
+from importlib import import_module
+
 # Local Folder
-from .EAS2Text import EAS2Text
+from .batch import DecodeResult, decodeMany, decodeOne, decodeRecords
+from .bursts import BurstReconciler, decodeBursts, reconcile, reconcileStream
+from .cache import DecodeCache
+from .clock import Clock, getClock
+from .EAS2Text import EAS2Text, InvalidSAME, MissingSAME, ParsedAlert
+from .metrics import (
+    Instruments,
+    disableInstrumentation,
+    enableInstrumentation,
+    getInstruments,
+)
+from .parser import Validation, isValid, validate
+from .records import AlertRecord
+from .renderers import Renderer, Rendering, getRenderer, registerRenderer
+from .stream import HeaderScanner, decodeStream, iterHeaders
+from .subscribers import SubscriberIndex
+from .tables import addOverrides, getTables, resetTables
+
+## asyncio and multiprocessing are slow to import, only load them when used
+__lazy__ = {"decodeAsync": "aio", "decodeParallel": "parallel"}
+
+
+def __getattr__(name):
+    if name in __lazy__:
+        return getattr(import_module(f".{__lazy__[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,7 @@
+# Standard Library
+import sys
+
+# Local Folder
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,79 @@
+# Standard Library
+from asyncio import Queue, get_running_loop
+
+# Local Folder
+from .batch import decodeMany
+from .stream import CHUNK_SIZE, HeaderScanner
+from .tables import getTables
+
+QUEUE_SIZE = 64
+
+__end = object()
+
+
+async def __chunks__(source, chunkSize: int):
+    if hasattr(source, "read"):
+        ## asyncio.StreamReader (or anything with an awaitable read)
+        while True:
+            chunk = await source.read(chunkSize)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in source:
+            yield chunk
+
+
+async def __produce__(
+    source, queue: Queue, timeZone, mode, executor, inline, chunkSize
+) -> None:
+    loop = get_running_loop()
+    scanner = HeaderScanner()
+    try:
+        async for chunk in __chunks__(source, chunkSize):
+            headers = scanner.feed(chunk)
+            if not headers:
+                continue
+            if inline:
+                results = decodeMany(headers, timeZone, mode)
+            else:
+                ## One hop to the executor per chunk, not per header
+                results = await loop.run_in_executor(
+                    executor, decodeMany, headers, timeZone, mode
+                )
+            for result in results:
+                ## Waits while the queue is full, so reading pauses too
+                await queue.put(result)
+    except Exception as E:
+        await queue.put(E)
+    await queue.put(__end)
+
+
+async def decodeAsync(
+    source,
+    timeZone: int = None,
+    mode: str = "NONE",
+    queueSize: int = QUEUE_SIZE,
+    executor=None,
+    chunkSize: int = CHUNK_SIZE,
+    inline: bool = False,
+):
+    ## Decodes run on executor (the loop's default one if None), unless
+    ## inline is set, which decodes on the event loop itself
+    loop = get_running_loop()
+    ## Parsing the tables is the only slow part, keep it off the loop
+    await loop.run_in_executor(None, getTables)
+    queue = Queue(queueSize)
+    producer = loop.create_task(
+        __produce__(source, queue, timeZone, mode, executor, inline, chunkSize)
+    )
+    try:
+        while True:
+            result = await queue.get()
+            if result is __end:
+                break
+            if isinstance(result, Exception):
+                raise result
+            yield result
+    finally:
+        producer.cancel()
@@ -0,0 +1,62 @@
+# Standard Library
+from collections import namedtuple
+from itertools import islice
+
+# Local Folder
+from .EAS2Text import EAS2Text, ParsedAlert
+from .records import AlertRecord
+from .tables import getTables
+
+DecodeResult = namedtuple("DecodeResult", ["sameData", "alert", "error"])
+CHUNK_SIZE = 512  ## Headers per batch, see decodeParallel and the CLI
+
+
+def __batches__(headers, chunkSize: int):
+    headers = iter(headers)
+    while True:
+        chunk = list(islice(headers, chunkSize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def decodeOne(
+    sameData: str, timeZone: int = None, mode: str = "NONE"
+) -> DecodeResult:
+    try:
+        alert = EAS2Text(sameData, timeZone=timeZone, mode=mode)
+    except Exception as E:
+        return DecodeResult(sameData, None, E)
+    return DecodeResult(sameData, alert, None)
+
+
+def decodeMany(headers, timeZone: int = None, mode: str = "NONE") -> list:
+    ## Clock and tables are read once for the whole batch
+    clock = EAS2Text.__clock__(timeZone)
+    getTables()
+    results = []
+    for sameData in headers:
+        try:
+            alert = EAS2Text.__fromClock__(sameData, mode, clock)
+        except Exception as E:
+            results.append(DecodeResult(sameData, None, E))
+        else:
+            results.append(DecodeResult(sameData, alert, None))
+    return results
+
+
+def decodeRecords(headers, timeZone: int = None, mode: str = "NONE") -> list:
+    ## Like decodeMany, but keeps compact AlertRecords instead of EAS2Text
+    clock = EAS2Text.__clock__(timeZone)
+    getTables()
+    results = []
+    for sameData in headers:
+        try:
+            record = AlertRecord.fromParsed(
+                ParsedAlert.__fromClock__(sameData, clock), mode
+            )
+        except Exception as E:
+            results.append(DecodeResult(sameData, None, E))
+        else:
+            results.append(DecodeResult(sameData, record, None))
+    return results
@@ -0,0 +1,213 @@
+# Standard Library
+from collections import Counter, OrderedDict
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from time import monotonic
+
+# Local Folder
+from .batch import decodeOne
+from .parser import isValid
+
+BURSTS = 3  ## Every SAME header is sent three times
+WINDOW = 10.0  ## Seconds from the first burst to the last
+MAX_ERRORS = 8  ## Differing characters still counted as the same header
+DEDUPE_WINDOW = 900.0
+DEDUPE_SIZE = 1024
+QUEUE_SIZE = 64
+
+__end = object()
+
+
+def reconcile(bursts) -> str:
+    ## Per-character majority vote across the bursts of one header
+    bursts = [burst.strip() for burst in bursts]
+    length = Counter(len(burst) for burst in bursts).most_common(1)[0][0]
+    candidates = [burst for burst in bursts if len(burst) == length]
+    voted = "".join(
+        Counter(chars).most_common(1)[0][0] for chars in zip(*candidates)
+    )
+    if len(bursts) == 1 or isValid(voted):
+        return voted
+    ## Two bursts disagreeing can tie, so fall back to one that parses
+    for burst in bursts:
+        if isValid(burst):
+            return burst
+    return voted
+
+
+def __similar__(first: str, second: str, maxErrors: int) -> bool:
+    errors = abs(len(first) - len(second))
+    for a, b in zip(first, second):
+        if a != b:
+            errors += 1
+            if errors > maxErrors:
+                return False
+    return errors <= maxErrors
+
+
+class BurstReconciler(object):
+    def __init__(
+        self,
+        window: float = WINDOW,
+        maxErrors: int = MAX_ERRORS,
+        dedupeWindow: float = DEDUPE_WINDOW,
+        dedupeSize: int = DEDUPE_SIZE,
+    ) -> None:
+        if dedupeSize < 1:
+            raise ValueError("dedupeSize must be at least 1")
+        self.window = window
+        self.maxErrors = maxErrors
+        self.dedupeWindow = dedupeWindow
+        self.dedupeSize = dedupeSize
+        self.bursts = 0
+        self.groups = 0
+        self.corrected = 0
+        self.duplicates = 0
+        self.__pending = []
+        self.__started = None
+        self.__seen = OrderedDict()  ## header -> first time it went out
+
+    def feed(self, sameData: str, when: float = None) -> list:
+        ## Returns the reconciled headers that are ready, usually none
+        sameData = sameData.strip()
+        if not sameData:
+            return []
+        if when is None:
+            when = monotonic()
+        self.bursts += 1
+        ready = []
+        pending = self.__pending
+        if pending and (
+            when - self.__started > self.window
+            or not __similar__(pending[0], sameData, self.maxErrors)
+        ):
+            ready += self.flush(when)
+        if not pending:
+            self.__started = when
+        pending.append(sameData)
+        if len(pending) >= BURSTS:
+            ready += self.flush(when)
+        return ready
+
+    def expire(self, when: float = None) -> list:
+        ## Closes a group whose window ran out with fewer than 3 bursts,
+        ## call it every so often when no new header has come in
+        if self.__started is None:
+            return []
+        if when is None:
+            when = monotonic()
+        if when - self.__started <= self.window:
+            return []
+        return self.flush(when)
+
+    def timeLeft(self, when: float = None):
+        ## Seconds until expire() has something to do, None if nothing pending
+        if self.__started is None:
+            return None
+        if when is None:
+            when = monotonic()
+        return max(0.0, self.__started + self.window - when)
+
+    def flush(self, when: float = None) -> list:
+        ## Closes the current group, e.g. at the end of a stream
+        pending = self.__pending
+        if not pending:
+            return []
+        if when is None:
+            when = monotonic()
+        sameData = reconcile(pending)
+        self.groups += 1
+        if any(burst != sameData for burst in pending):
+            self.corrected += 1
+        del pending[:]
+        self.__started = None
+        ## Every alert ends with an EOM, those are never duplicates
+        if sameData != "NNNN" and not self.__isNew__(sameData, when):
+            return []
+        return [sameData]
+
+    def __isNew__(self, sameData: str, when: float) -> bool:
+        seen = self.__seen
+        while seen:
+            header, first = next(iter(seen.items()))
+            if when - first <= self.dedupeWindow:
+                break
+            del seen[header]
+        if sameData in seen:
+            self.duplicates += 1
+            return False
+        seen[sameData] = when
+        while len(seen) > self.dedupeSize:
+            seen.popitem(last=False)
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "bursts": self.bursts,
+            "groups": self.groups,
+            "corrected": self.corrected,
+            "duplicates": self.duplicates,
+            "pending": len(self.__pending),
+        }
+
+    def clear(self) -> None:
+        del self.__pending[:]
+        self.__started = None
+        self.__seen.clear()
+
+
+def __read__(headers, items: Queue, stop: Event) -> None:
+    ## Runs in a thread, so a quiet source can't hold back expire()
+    try:
+        for item in headers:
+            if not __put__(items, stop, item):
+                return
+    except Exception as E:
+        __put__(items, stop, E)
+    __put__(items, stop, __end)
+
+
+def __put__(items: Queue, stop: Event, item) -> bool:
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except Full:
+            pass
+    return False
+
+
+def reconcileStream(headers, **kwargs):
+    ## Headers, or (when, header) pairs from a receiver with timestamps
+    reconciler = BurstReconciler(**kwargs)
+    items = Queue(QUEUE_SIZE)
+    stop = Event()
+    reader = Thread(target=__read__, args=(headers, items, stop), daemon=True)
+    reader.start()
+    timed = False  ## Source timestamps can't be compared with our clock
+    try:
+        while True:
+            try:
+                item = items.get(
+                    timeout=None if timed else reconciler.timeLeft()
+                )
+            except Empty:
+                yield from reconciler.expire()
+                continue
+            if item is __end:
+                break
+            if isinstance(item, Exception):
+                raise item
+            if isinstance(item, str):
+                yield from reconciler.feed(item)
+            else:
+                timed = True
+                yield from reconciler.feed(item[1], item[0])
+        yield from reconciler.flush()
+    finally:
+        stop.set()
+
+
+def decodeBursts(headers, timeZone: int = None, mode: str = "NONE", **kwargs):
+    for sameData in reconcileStream(headers, **kwargs):
+        yield decodeOne(sameData, timeZone, mode)
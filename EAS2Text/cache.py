@@ -0,0 +1,82 @@
+# Standard Library
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+# Local Folder
+from .EAS2Text import ParsedAlert
+from .records import AlertRecord
+
+
+class DecodeCache(object):
+    def __init__(self, maxSize: int = 1024, ttl: float = 300.0) -> None:
+        ## ttl bounds how stale the local clock / year baked into a result can be
+        if maxSize < 1:
+            raise ValueError("maxSize must be at least 1")
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.__entries = OrderedDict()
+        self.__lock = Lock()
+
+    def decode(
+        self, sameData: str, timeZone: int = None, mode: str = "NONE"
+    ) -> AlertRecord:
+        key = (sameData.strip(), timeZone, mode)
+        now = monotonic()
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                if self.ttl is None or now - entry[0] < self.ttl:
+                    self.__entries.move_to_end(key)
+                    self.hits += 1
+                    return self.__unpack__(entry)
+                del self.__entries[key]
+                self.expirations += 1
+            self.misses += 1
+
+        try:
+            entry = (
+                now,
+                AlertRecord.fromParsed(ParsedAlert(key[0], timeZone), mode),
+                None,
+            )
+        except Exception as E:
+            ## Garbage gets relayed too, so failures are cached as well. Only
+            ## how to rebuild the error is kept, each caller gets a fresh one
+            entry = (now, None, E.__reduce__())
+
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxSize:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+        return self.__unpack__(entry)
+
+    @staticmethod
+    def __unpack__(entry) -> AlertRecord:
+        if entry[2] is not None:
+            error = entry[2][0](*entry[2][1])
+            if len(entry[2]) > 2 and entry[2][2]:
+                error.__dict__.update(entry[2][2])
+            raise error
+        return entry[1]
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "maxSize": self.maxSize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
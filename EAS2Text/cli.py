@@ -0,0 +1,142 @@
+# Standard Library
+import sys
+from argparse import ArgumentParser
+from collections import Counter
+from csv import writer
+from time import perf_counter
+
+# Local Folder
+from .batch import CHUNK_SIZE, __batches__, decodeRecords
+from .records import FIELDS
+from .stream import iterHeaders
+
+OUTPUT_BUFFER = 1 << 20  ## Bytes buffered before hitting the output file
+
+
+def __lines__(source):
+    ## One header per line, so malformed lines still show up as errors
+    for line in source:
+        line = line.strip()
+        if line:
+            yield line.decode("latin-1")
+
+
+def __headers__(paths: list, scan: bool):
+    for path in paths or ["-"]:
+        if path == "-":
+            source = sys.stdin.buffer
+            yield from iterHeaders(source) if scan else __lines__(source)
+            continue
+        with open(path, "rb") as source:
+            yield from iterHeaders(source) if scan else __lines__(source)
+
+
+def __timeZone__(value: str):
+    ## Hours from UTC ("-5") or a zone name ("America/Chicago")
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def __results__(headers, args):
+    if args.workers > 1:
+        ## Only pay for importing multiprocessing when it is used
+        from .parallel import decodeParallel  # isort: skip
+
+        yield from decodeParallel(
+            headers, args.timeZone, args.mode, args.workers, args.chunkSize
+        )
+        return
+    for chunk in __batches__(headers, args.chunkSize):
+        yield from decodeRecords(chunk, args.timeZone, args.mode)
+
+
+def parseArgs(argv=None):
+    parser = ArgumentParser(
+        prog="eas2text",
+        description="Bulk decode SAME headers to JSONL or CSV",
+    )
+    parser.add_argument(
+        "files", nargs="*", help="header logs to read, - or none for stdin"
+    )
+    parser.add_argument("-m", "--mode", default="NONE")
+    parser.add_argument(
+        "-t",
+        "--timeZone",
+        type=__timeZone__,
+        default=None,
+        help="UTC offset in hours or a zone name, local time if left out",
+    )
+    parser.add_argument(
+        "-f", "--format", choices=["jsonl", "csv"], default="jsonl"
+    )
+    parser.add_argument("-o", "--output", help="write here instead of stdout")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="decode across this many processes",
+    )
+    parser.add_argument("--chunkSize", type=int, default=CHUNK_SIZE)
+    parser.add_argument(
+        "--scan",
+        action="store_true",
+        help="pull headers out of arbitrary text instead of one per line",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="no summary on stderr"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parseArgs(argv)
+    output = (
+        open(args.output, "w", buffering=OUTPUT_BUFFER, newline="")
+        if args.output
+        else sys.stdout
+    )
+    csv = writer(output) if args.format == "csv" else None
+    if csv is not None:
+        csv.writerow(FIELDS)
+
+    decoded = 0
+    errors = Counter()
+    started = perf_counter()
+    try:
+        results = __results__(__headers__(args.files, args.scan), args)
+        for chunk in __batches__(results, args.chunkSize):
+            records = []
+            for result in chunk:
+                if result.error is None:
+                    records.append(result.alert)
+                else:
+                    errors[getattr(result.error, "code", None) or "OTHER"] += 1
+            decoded += len(records)
+            ## One write per chunk rather than one per alert
+            if csv is not None:
+                csv.writerows(record.toCSVRow() for record in records)
+            elif records:
+                output.write(
+                    "\n".join(record.toJSON() for record in records) + "\n"
+                )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        else:
+            output.flush()
+    elapsed = perf_counter() - started
+
+    if not args.quiet:
+        total = decoded + sum(errors.values())
+        print(
+            f"{total} headers, {decoded} decoded, {sum(errors.values())}"
+            f" errors in {elapsed:.2f}s"
+            f" ({total / elapsed if elapsed else 0:.0f} headers/sec)",
+            file=sys.stderr,
+        )
+        for code, count in errors.most_common():
+            print(f"  {code}: {count}", file=sys.stderr)
+    return 0
@@ -0,0 +1,137 @@
+# Standard Library
+from collections import namedtuple
+from datetime import datetime as DT
+from datetime import timedelta, timezone
+from functools import lru_cache
+from time import gmtime, localtime, time
+
+try:
+    # Standard Library
+    from zoneinfo import ZoneInfo
+except ImportError:  ## Python < 3.9
+    ZoneInfo = None
+
+## JJJ is an issue time, so it may only be this many days ahead of today
+SKEW_DAYS = 1
+MAX_CLOCKS = 64
+
+Clock = namedtuple(
+    "Clock", ["dtOffset", "year", "yearDay", "tzName", "zone", "minute"]
+)
+
+__clocks = {}
+
+
+def getTZ(tzOffset) -> str:
+    tzone = int(tzOffset / 3600.0)
+    locTime = localtime().tm_isdst
+    TMZ = "UTC"
+    if tzone == 3 and locTime > 0:
+        TMZ = "ADT"
+    elif tzone == 4:
+        TMZ = "AST"
+        if locTime > 0:
+            TMZ = "EDT"
+    elif tzone == 5:
+        TMZ = "EST"
+        if locTime > 0:
+            TMZ = "CDT"
+    elif tzone == 6:
+        TMZ = "CST"
+        if locTime > 0:
+            TMZ = "MDT"
+    elif tzone == 7:
+        TMZ = "MST"
+        if locTime > 0:
+            TMZ = "PDT"
+    elif tzone == 8:
+        TMZ = "PST"
+    return TMZ
+
+
+def getZone(timeZone):
+    ## IANA names ("America/Chicago") or any tzinfo; None for plain offsets
+    if timeZone is None or isinstance(timeZone, (int, float)):
+        return None
+    if isinstance(timeZone, str):
+        if ZoneInfo is None:
+            raise ValueError("Time zone names need Python 3.9+ (zoneinfo)")
+        return ZoneInfo(timeZone)
+    return timeZone
+
+
+def __makeClock__(timeZone, now: float, minute: int) -> Clock:
+    utc = gmtime(now)
+    zone = getZone(timeZone)
+    if zone is not None:
+        ## Offset and name depend on the alert time, see alertTimes
+        dtOffset = None
+        tzName = None
+    elif timeZone is None:
+        local = localtime(now)
+        dtOffset = -local.tm_gmtoff
+        tzName = local.tm_zone
+    else:
+        dtOffset = -timeZone * 3600
+        tzName = getTZ(dtOffset)
+    return Clock(dtOffset, utc.tm_year, utc.tm_yday, tzName, zone, minute)
+
+
+def getClock(timeZone=None) -> Clock:
+    ## Offset, year and zone name only change on minute boundaries
+    now = time()
+    minute = int(now // 60)
+    cached = __clocks.get(timeZone)
+    if cached is not None and cached.minute == minute:
+        return cached
+    clock = __makeClock__(timeZone, now, minute)
+    if len(__clocks) >= MAX_CLOCKS:
+        __clocks.clear()
+    __clocks[timeZone] = clock
+    return clock
+
+
+@lru_cache(maxsize=64)
+def __yearStart__(year: int) -> tuple:
+    start = DT(year, 1, 1)
+    return start, (DT(year + 1, 1, 1) - start).days
+
+
+def alertYear(clock: Clock, day: int) -> DT:
+    ## Latest year in which JJJ isn't in the future (give or take SKEW_DAYS),
+    ## raises if none of them has such a day
+    today = __yearStart__(clock.year)[0] + timedelta(days=clock.yearDay - 1)
+    for year in (clock.year + 1, clock.year, clock.year - 1):
+        yearStart, yearDays = __yearStart__(year)
+        if not 1 <= day <= yearDays:
+            continue
+        if (yearStart - today).days + day - 1 <= SKEW_DAYS:
+            return yearStart
+    raise ValueError(f"Day {day} does not exist around {clock.year}")
+
+
+def alertTimes(clock: Clock, timeStamp: str, purge) -> tuple:
+    ## JJJHHMM (UTC) + purge HHMM -> local start, end, zone name and offset
+    day = int(timeStamp[:3])
+    yearStart = alertYear(clock, day)
+    start = yearStart + timedelta(
+        days=day - 1, hours=int(timeStamp[3:5]), minutes=int(timeStamp[5:7])
+    )
+    end = start + timedelta(hours=int(purge[0]), minutes=int(purge[1]))
+    if clock.zone is None:
+        shift = timedelta(seconds=-clock.dtOffset)
+        return start + shift, end + shift, clock.tzName, clock.dtOffset
+    start = start.replace(tzinfo=timezone.utc).astimezone(clock.zone)
+    end = end.replace(tzinfo=timezone.utc).astimezone(clock.zone)
+    return (
+        start.replace(tzinfo=None),
+        end.replace(tzinfo=None),
+        end.tzname(),
+        -end.utcoffset().total_seconds(),
+    )
+
+
+@lru_cache(maxsize=4096)
+def formatTime(when: DT, format: str) -> str:
+    ## The same handful of alert times get formatted over and over
+    return when.strftime(format)
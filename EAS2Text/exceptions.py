@@ -0,0 +1,34 @@
+class InvalidSAME(Exception):
+    def __init__(
+        self,
+        error,
+        message="Invalid Data in SAME Message",
+        code=None,
+        offset=None,
+    ):
+        self.message = message
+        self.error = error
+        self.code = code  ## One of the parser.* error codes, when known
+        self.offset = offset  ## Position in the header the error was found
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f"{self.message}: {self.error}"
+
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (self.error, self.message, self.code, self.offset),
+        )
+
+
+class MissingSAME(Exception):
+    code = "MISSING"
+    offset = 0
+
+    def __init__(self, message="Missing SAME Message"):
+        self.message = message
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f"{self.message}"
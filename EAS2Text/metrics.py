@@ -0,0 +1,127 @@
+# Standard Library
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+
+# Local Folder
+from .tables import getTables
+
+## The decode path only checks this, so nothing is timed or counted unless on
+ACTIVE = None
+
+STAGES = ("tables", "header", "fips", "times", "codes", "render")
+
+
+class Instruments(object):
+    def __init__(self) -> None:
+        self.hooks = []
+        self.__lock = Lock()
+        self.__counters = defaultdict(Counter)
+        self.__stages = {}  ## stage -> [count, total, max]
+
+    def addHook(self, hook) -> None:
+        ## hook(stage, seconds), called after every timed stage
+        self.hooks.append(hook)
+
+    def removeHook(self, hook) -> None:
+        self.hooks.remove(hook)
+
+    def count(self, counter: str, key, amount: int = 1) -> None:
+        with self.__lock:
+            self.__counters[counter][key] += amount
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self.__lock:
+            timing = self.__stages.get(stage)
+            if timing is None:
+                timing = self.__stages[stage] = [0, 0.0, 0.0]
+            timing[0] += 1
+            timing[1] += seconds
+            if seconds > timing[2]:
+                timing[2] = seconds
+        for hook in self.hooks:
+            hook(stage, seconds)
+
+    def __lap__(self, stage: str, started: float) -> float:
+        now = perf_counter()
+        self.record(stage, now - started)
+        return now
+
+    @contextmanager
+    def stage(self, stage: str):
+        ## Times any block of your own, e.g. dispatching the decoded alert
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.__lap__(stage, started)
+
+    def parse(self, alert, sameData: str, clock) -> None:
+        ## ParsedAlert's own stage sequence, with a lap after each stage
+        started = [perf_counter()]
+
+        def lap(stage: str) -> None:
+            started[0] = self.__lap__(stage, started[0])
+
+        try:
+            alert.__stages__(sameData, clock, lap)
+        except Exception as E:
+            self.count("invalid", getattr(E, "code", None))
+            raise
+        if alert.EOM:
+            return
+        stats = getTables()
+        for code in alert.FIPS:
+            if code[0] not in stats.SUBDIV or code[1:] not in stats.SAME:
+                self.count("unknown", "FIPS")
+        if alert.org not in stats.ORGS:
+            self.count("unknown", "originator")
+        if alert.evnt not in stats.EVENTS:
+            self.count("unknown", "event")
+
+    def render(self, alert, mode: str):
+        started = perf_counter()
+        rendering = alert.__render__(mode)
+        self.__lap__("render", started)
+        self.count("decoded", mode)
+        return rendering
+
+    def snapshot(self) -> dict:
+        ## Plain dicts, safe to hand to a metrics exporter
+        with self.__lock:
+            return {
+                "counters": {
+                    counter: dict(counts)
+                    for counter, counts in self.__counters.items()
+                },
+                "stages": {
+                    stage: {
+                        "count": count,
+                        "total": total,
+                        "mean": total / count,
+                        "max": longest,
+                    }
+                    for stage, (count, total, longest) in self.__stages.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__counters.clear()
+            self.__stages.clear()
+
+
+def enableInstrumentation(instruments: Instruments = None) -> Instruments:
+    global ACTIVE
+    ACTIVE = instruments if instruments is not None else Instruments()
+    return ACTIVE
+
+
+def disableInstrumentation() -> None:
+    global ACTIVE
+    ACTIVE = None
+
+
+def getInstruments() -> Instruments:
+    return ACTIVE
@@ -0,0 +1,66 @@
+# Standard Library
+from collections import deque
+from multiprocessing import Pool, cpu_count
+from queue import Queue
+
+# Local Folder
+from .batch import CHUNK_SIZE, __batches__, decodeRecords
+from .tables import getTables
+
+__settings = None
+
+
+def __setup__(timeZone: int, mode: str) -> None:
+    ## Runs once in every worker process
+    global __settings
+    __settings = (timeZone, mode)
+    getTables()
+
+
+def __decodeChunk__(chunk: list) -> list:
+    timeZone, mode = __settings
+    return decodeRecords(chunk, timeZone=timeZone, mode=mode)
+
+
+def decodeParallel(
+    headers,
+    timeZone: int = None,
+    mode: str = "NONE",
+    workers: int = None,
+    chunkSize: int = CHUNK_SIZE,
+    ordered: bool = True,
+):
+    workers = workers or cpu_count()
+    window = workers * 4  ## Chunks in flight, keeps the input lazy
+    with Pool(workers, __setup__, (timeZone, mode)) as pool:
+        if ordered:
+            pending = deque()
+            for chunk in __batches__(headers, chunkSize):
+                pending.append(pool.apply_async(__decodeChunk__, (chunk,)))
+                if len(pending) >= window:
+                    yield from pending.popleft().get()
+            while pending:
+                yield from pending.popleft().get()
+        else:
+            done = Queue()
+            inFlight = 0
+            for chunk in __batches__(headers, chunkSize):
+                pool.apply_async(
+                    __decodeChunk__,
+                    (chunk,),
+                    callback=done.put,
+                    error_callback=done.put,
+                )
+                inFlight += 1
+                if inFlight >= window:
+                    yield from __unpack__(done.get())
+                    inFlight -= 1
+            while inFlight:
+                yield from __unpack__(done.get())
+                inFlight -= 1
+
+
+def __unpack__(results) -> list:
+    if isinstance(results, BaseException):
+        raise results
+    return results
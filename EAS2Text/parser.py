@@ -0,0 +1,169 @@
+# Standard Library
+from collections import namedtuple
+from re import compile
+
+# Local Folder
+from .clock import Clock, alertYear, getClock
+from .exceptions import InvalidSAME, MissingSAME
+
+## Error codes, as found on InvalidSAME.code and Validation.code
+MISSING = "MISSING"
+NO_START = "NO_START"
+STRUCTURE = "STRUCTURE"
+ORIGINATOR = "ORIGINATOR"
+EVENT = "EVENT"
+FIPS = "FIPS"
+FIPS_COUNT = "FIPS_COUNT"
+PURGE = "PURGE"
+TIMESTAMP = "TIMESTAMP"
+CALLSIGN = "CALLSIGN"
+
+MESSAGES = {
+    MISSING: "Missing SAME Message",
+    NO_START: '"ZCZC" Start string missing',
+    STRUCTURE: "Malformed SAME Header",
+    ORIGINATOR: "Originator is invalid",
+    EVENT: "Event Code is invalid",
+    FIPS: "Invalid codes in FIPS data",
+    FIPS_COUNT: "Header must have 1 to 31 FIPS codes",
+    PURGE: "Purge Time not HHMM.",
+    TIMESTAMP: "Timestamp not JJJHHMM.",
+    CALLSIGN: "Callsign is invalid",
+}
+
+MAX_FIPS = 31
+
+## ZCZC-ORG-EEE-PSSCCC(-PSSCCC x30)+TTTT-JJJHHMM-LLLLLLLL-
+HEADER = compile(
+    r"ZCZC-([^-+]{3})-([^-+]{3})-([0-9]{6}(?:-[0-9]{6}){0,30})"
+    r"\+([0-9]{2})([0-9]{2})-([0-9]{3})([0-9]{2})([0-9]{2})-([^-+]*)-"
+)
+
+Header = namedtuple(
+    "Header", ["org", "evnt", "FIPS", "purge", "timeStamp", "callsign"]
+)
+Validation = namedtuple("Validation", ["valid", "code", "offset", "message"])
+VALID = Validation(True, None, None, None)
+
+
+def __ranges__(match) -> tuple:
+    ## Digits are already checked by HEADER, only the values are left
+    if match.group(5) >= "60":
+        return PURGE, match.start(4)
+    day = match.group(6)
+    if (
+        day == "000"
+        or day > "366"
+        or match.group(7) >= "24"
+        or match.group(8) >= "60"
+    ):
+        return TIMESTAMP, match.start(6)
+    return None
+
+
+def __diagnose__(sameData: str) -> tuple:
+    ## Only run once HEADER has failed, to say what and where
+    if not sameData.startswith("ZCZC"):
+        return NO_START, 0
+    if sameData[4:5] != "-":
+        return STRUCTURE, 4
+    if sameData[12:13] == "+":
+        return FIPS_COUNT, 12
+    for code, start in ((ORIGINATOR, 5), (EVENT, 9)):
+        field = sameData[start : start + 3]
+        if (
+            len(field) != 3
+            or "-" in field
+            or "+" in field
+            or sameData[start + 3 : start + 4] != "-"
+        ):
+            return code, start
+    plus = sameData.find("+", 13)
+    if plus == -1:
+        return STRUCTURE, len(sameData)
+    offset = 13
+    codes = sameData[13:plus].split("-")
+    for code in codes:
+        if len(code) != 6 or not code.isdigit() or not code.isascii():
+            return FIPS, offset
+        offset += 7
+    if len(codes) > MAX_FIPS:
+        return FIPS_COUNT, 13
+    purge = sameData[plus + 1 : plus + 5]
+    if (
+        len(purge) != 4
+        or not purge.isdigit()
+        or sameData[plus + 5 : plus + 6] != "-"
+    ):
+        return PURGE, plus + 1
+    timeStamp = sameData[plus + 6 : plus + 13]
+    if (
+        len(timeStamp) != 7
+        or not timeStamp.isdigit()
+        or sameData[plus + 13 : plus + 14] != "-"
+    ):
+        return TIMESTAMP, plus + 6
+    callsign = plus + 14
+    end = sameData.find("-", callsign)
+    if end == -1 or "+" in sameData[callsign:end]:
+        return CALLSIGN, callsign
+    return STRUCTURE, end + 1
+
+
+def __leapDay__(match, clock: Clock) -> tuple:
+    ## Day 366 only exists in leap years, decided like EAS2Text does
+    if match.group(6) != "366":
+        return None
+    try:
+        alertYear(clock or getClock(), 366)
+    except ValueError:
+        return TIMESTAMP, match.start(6)
+    return None
+
+
+def validate(sameData: str, clock: Clock = None) -> Validation:
+    ## Structure only: no table lookups, no times, no text
+    sameData = sameData.strip()
+    if sameData == "":
+        return Validation(False, MISSING, 0, MESSAGES[MISSING])
+    if sameData.startswith("NNNN"):
+        return VALID
+    match = HEADER.fullmatch(sameData)
+    if match is not None:
+        error = __ranges__(match) or __leapDay__(match, clock)
+        if error is None:
+            return VALID
+    else:
+        error = __diagnose__(sameData)
+    return Validation(False, error[0], error[1], MESSAGES[error[0]])
+
+
+def isValid(sameData: str, clock: Clock = None) -> bool:
+    return validate(sameData, clock).valid
+
+
+def parseHeader(sameData: str) -> Header:
+    ## Expects a stripped, non-EOM header, raises like EAS2Text does
+    if sameData == "":
+        raise MissingSAME()
+    match = HEADER.fullmatch(sameData)
+    error = __diagnose__(sameData) if match is None else __ranges__(match)
+    if error is not None:
+        code, offset = error
+        raise InvalidSAME(
+            sameData[offset:] or sameData,
+            message=MESSAGES[code],
+            code=code,
+            offset=offset,
+        )
+    org, evnt, codes, purgeH, purgeM, day, hour, minute, callsign = (
+        match.groups()
+    )
+    return Header(
+        org,
+        evnt,
+        list(dict.fromkeys(codes.split("-"))),  ## Drop repeats, keep order
+        [purgeH, purgeM],
+        day + hour + minute,
+        callsign.strip(),
+    )
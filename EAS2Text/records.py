@@ -0,0 +1,117 @@
+# Standard Library
+from collections import namedtuple
+from datetime import datetime as DT
+from json import dumps, loads
+
+FIELDS = [
+    "EASData",
+    "org",
+    "evnt",
+    "FIPS",
+    "FIPSText",
+    "strFIPS",
+    "purge",
+    "timeStamp",
+    "startTime",
+    "endTime",
+    "orgText",
+    "evntText",
+    "startTimeText",
+    "endTimeText",
+    "callsign",
+    "EASText",
+]
+LISTS = frozenset(["FIPS", "FIPSText", "purge"])
+TIMES = frozenset(["startTime", "endTime"])
+CSV_SEPARATOR = "|"  ## Joins FIPS / FIPSText / purge inside one CSV cell
+
+
+class AlertRecord(namedtuple("AlertRecord", FIELDS)):
+    ## Plain tuple underneath: no per-record __dict__, and immutable
+    __slots__ = ()
+
+    @classmethod
+    def fromAlert(cls, alert) -> "AlertRecord":
+        ## EOM (NNNN) alerts only carry a few of the fields
+        values = []
+        for field in FIELDS:
+            value = getattr(alert, field, None)
+            values.append(tuple(value) if isinstance(value, list) else value)
+        return cls(*values)
+
+    @classmethod
+    def fromParsed(cls, alert, mode: str = "NONE") -> "AlertRecord":
+        ## Straight from a ParsedAlert, without building an EAS2Text
+        rendering = alert.render(mode)
+        if alert.EOM:
+            return cls(
+                **dict(
+                    dict.fromkeys(FIELDS),
+                    EASData=alert.EASData,
+                    FIPS=(),
+                    FIPSText=(),
+                    strFIPS=rendering.strFIPS,
+                    EASText=rendering.EASText,
+                )
+            )
+        return cls(
+            alert.EASData,
+            alert.org,
+            alert.evnt,
+            tuple(alert.FIPS),
+            tuple(alert.FIPSText),
+            rendering.strFIPS,
+            tuple(alert.purge),
+            alert.timeStamp,
+            alert.startTime,
+            alert.endTime,
+            rendering.orgText,
+            rendering.evntText,
+            rendering.startTimeText,
+            rendering.endTimeText,
+            alert.callsign,
+            rendering.EASText,
+        )
+
+    def toDict(self) -> dict:
+        return dict(zip(FIELDS, self))
+
+    def toJSON(self) -> str:
+        return dumps(
+            {
+                field: value.isoformat() if isinstance(value, DT) else value
+                for field, value in zip(FIELDS, self)
+            },
+            separators=(",", ":"),
+        )
+
+    def toCSVRow(self) -> list:
+        row = []
+        for value in self:
+            if value is None:
+                row.append("")
+            elif isinstance(value, tuple):
+                row.append(CSV_SEPARATOR.join(value))
+            elif isinstance(value, DT):
+                row.append(value.isoformat())
+            else:
+                row.append(value)
+        return row
+
+    @classmethod
+    def fromDict(cls, data: dict) -> "AlertRecord":
+        values = []
+        for field in FIELDS:
+            value = data.get(field)
+            if value is None:
+                pass
+            elif field in LISTS:
+                value = tuple(value)
+            elif field in TIMES and isinstance(value, str):
+                value = DT.fromisoformat(value)
+            values.append(value)
+        return cls(*values)
+
+    @classmethod
+    def fromJSON(cls, text: str) -> "AlertRecord":
+        return cls.fromDict(loads(text))
@@ -0,0 +1,270 @@
+# Standard Library
+from collections import namedtuple
+
+# Local Folder
+from .clock import formatTime
+
+Rendering = namedtuple(
+    "Rendering",
+    [
+        "strFIPS",
+        "orgText",
+        "evntText",
+        "startTimeText",
+        "endTimeText",
+        "EASText",
+    ],
+)
+
+MAX_NAMES = 8192  ## Cached area name rewrites per renderer
+
+
+class Renderer(object):
+
+    template = "{orgText} has issued {evntText} for {strFIPS} beginning at {startTimeText} and ending at {endTimeText}. Message from {callsign}."
+    fipsSeparator = "; "
+    fipsTerminator = ";"
+
+    def __init__(
+        self,
+        template: str = None,
+        orgOverrides: dict = None,
+        fipsSeparator: str = None,
+        fipsTerminator: str = None,
+    ) -> None:
+        if template is not None:
+            self.template = template
+        if fipsSeparator is not None:
+            self.fipsSeparator = fipsSeparator
+        if fipsTerminator is not None:
+            self.fipsTerminator = fipsTerminator
+        self.orgOverrides = dict(orgOverrides or {})
+        self.format = self.template.format
+        self.__names = {}
+
+    def fipsName(self, name: str) -> str:
+        return name
+
+    def fips(self, alert) -> str:
+        ## Area names repeat constantly, so rewrite each one only once
+        names = self.__names
+        if len(names) > MAX_NAMES:
+            names.clear()
+        parts = []
+        for name in alert.FIPSText:
+            try:
+                parts.append(names[name])
+            except KeyError:
+                parts.append(names.setdefault(name, self.fipsName(name)))
+        return self.fipsSeparator.join(parts) + self.fipsTerminator
+
+    def organization(self, alert) -> str:
+        return self.orgOverrides.get(alert.org, alert.orgText)
+
+    def event(self, alert) -> str:
+        return alert.evntText
+
+    def times(self, alert) -> tuple:
+        return alert.startTimeText, alert.endTimeText
+
+    def text(self, alert, **fields) -> str:
+        return self.format(
+            callsign=alert.callsign,
+            verb="have" if alert.org == "CIV" else "has",
+            **fields,
+        )
+
+    def render(self, alert) -> Rendering:
+        strFIPS = self.fips(alert)
+        orgText = self.organization(alert)
+        evntText = self.event(alert)
+        startTimeText, endTimeText = self.times(alert)
+        EASText = self.text(
+            alert,
+            strFIPS=strFIPS,
+            orgText=orgText,
+            evntText=evntText,
+            startTimeText=startTimeText,
+            endTimeText=endTimeText,
+        )
+        return Rendering(
+            strFIPS, orgText, evntText, startTimeText, endTimeText, EASText
+        )
+
+
+class TFTRenderer(Renderer):
+
+    template = "{orgText} has issued {evntText} for the following counties/areas: {strFIPS} at {startTimeText} effective until {endTimeText}. message from {callsign}."
+    participantTemplate = "{evntText} has been issued for the following counties/areas: {strFIPS} at {startTimeText} effective until {endTimeText}. message from {callsign}."
+    fipsSeparator = ", "
+    fipsTerminator = ""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.participantFormat = self.participantTemplate.format
+
+    def fipsName(self, name: str) -> str:
+        return name.replace(",", "").replace("FIPS Code", "AREA")
+
+    def times(self, alert) -> tuple:
+        startTime, endTime = alert.startTime, alert.endTime
+        return (
+            formatTime(startTime, "%I:%M %p ON %b %d, %Y"),
+            (
+                formatTime(endTime, "%I:%M %p")
+                if startTime.day == endTime.day
+                else formatTime(endTime, "%I:%M %p ON %b %d, %Y")
+            ),
+        )
+
+    def text(self, alert, **fields) -> str:
+        if alert.org == "EAS" or alert.evnt in ["NPT", "EAN"]:
+            text = self.participantFormat(callsign=alert.callsign, **fields)
+        else:
+            text = self.format(callsign=alert.callsign, **fields)
+        return text.upper()
+
+
+class SageRenderer(Renderer):
+
+    template = "{orgText} {verb} issued {evntText} for {strFIPS} beginning at {startTimeText} and ending at {endTimeText} ({callsign})"
+    fipsSeparator = ", "
+    fipsTerminator = ""
+
+    def times(self, alert) -> tuple:
+        startTime, endTime = alert.startTime, alert.endTime
+        startTimeText = formatTime(startTime, "%I:%M %p").lower()
+        endTimeText = formatTime(endTime, "%I:%M %p").lower()
+        if startTime.day != endTime.day:
+            startTimeText += formatTime(startTime, " %a %b %d")
+            endTimeText += formatTime(endTime, " %a %b %d")
+        return startTimeText, endTimeText
+
+
+class TrilithicRenderer(Renderer):
+
+    template = "{orgText} {verb} issued {evntText} {bigFips} {strFIPS}. Effective Until {endTimeText}. ({callsign})"
+    fipsSeparator = " - "
+    fipsTerminator = ""
+
+    def fipsName(self, name: str) -> str:
+        ## Only the "and " in front of the last area, not "Maryland" or
+        ## "Highland County"
+        name = name.replace(",", "")
+        return name[4:] if name.startswith("and ") else name
+
+    def fips(self, alert) -> str:
+        if "000000" in alert.FIPS:
+            return "The United States"
+        return super().fips(alert)
+
+    def times(self, alert) -> tuple:
+        return "", formatTime(alert.endTime, "%m/%d/%y %H:%M:00 ") + (
+            alert.tzName
+        )
+
+    def text(self, alert, **fields) -> str:
+        if fields["strFIPS"] == "The United States":
+            bigFips = "for"
+        else:
+            bigFips = "for the following counties:"
+        return super().text(alert, bigFips=bigFips, **fields)
+
+
+class BurkRenderer(Renderer):
+
+    template = "{orgText} has issued {evntText} for the following counties/areas: {strFIPS} on {startTimeText} effective until {endTimeText}."
+    fipsSeparator = ", "
+    fipsTerminator = ""
+
+    def fipsName(self, name: str) -> str:
+        return name.replace(",", "")
+
+    def event(self, alert) -> str:
+        ## "a Tornado Warning" -> "TORNADO WARNING"
+        return " ".join(alert.evntText.split(" ")[1:]).upper()
+
+    def times(self, alert) -> tuple:
+        startTime = alert.startTime
+        return (
+            formatTime(startTime, "%B %d, %Y").upper()
+            + " at "
+            + formatTime(startTime, "%I:%M %p"),
+            formatTime(alert.endTime, "%I:%M %p, %B %d, %Y"),
+        )
+
+
+class DasdecRenderer(Renderer):
+
+    template = "{orgText} HAS ISSUED {evntText} FOR THE FOLLOWING COUNTIES/AREAS: {strFIPS} AT {startTimeText} EFFECTIVE UNTIL {endTimeText}. MESSAGE FROM {callsign}."
+
+    def organization(self, alert) -> str:
+        return super().organization(alert).upper()
+
+    def event(self, alert) -> str:
+        return alert.evntText.upper()
+
+    def times(self, alert) -> tuple:
+        return (
+            formatTime(alert.startTime, "%I:%M %p ON %b %d, %Y").upper(),
+            formatTime(alert.endTime, "%I:%M %p %b %d, %Y").upper(),
+        )
+
+    def text(self, alert, **fields) -> str:
+        return self.format(callsign=alert.callsign.upper(), **fields)
+
+
+RENDERERS = {}
+
+
+def registerRenderer(renderer: Renderer, *modes: str) -> Renderer:
+    for mode in modes:
+        RENDERERS[mode] = renderer
+    return renderer
+
+
+def getRenderer(mode: str) -> Renderer:
+    try:
+        return RENDERERS[mode]
+    except KeyError:
+        pass
+    ## Any other "SAGE..." mode is treated like the units always were
+    if mode.startswith("SAGE"):
+        if mode.endswith("DIGITAL"):
+            return RENDERERS["SAGE DIGITAL"]
+        return RENDERERS["SAGE EAS"]
+    return RENDERERS["NONE"]
+
+
+registerRenderer(Renderer(), "NONE")
+registerRenderer(TFTRenderer(), "TFT")
+registerRenderer(
+    SageRenderer(
+        orgOverrides={
+            "CIV": "The Civil Authorities",
+            "EAS": "A Broadcast station or cable system",
+        }
+    ),
+    "SAGE EAS",
+)
+registerRenderer(
+    SageRenderer(orgOverrides={"CIV": "The Civil Authorities"}),
+    "SAGE DIGITAL",
+)
+registerRenderer(
+    TrilithicRenderer(orgOverrides={"CIV": "Civil Authorities"}),
+    "TRILITHIC",
+    "VIAVI",
+    "EASY",
+)
+registerRenderer(
+    BurkRenderer(
+        orgOverrides={
+            "EAS": "A Broadcast station or cable system",
+            "CIV": "Civil Authorities",
+            "WXR": "National Weather Service",
+        }
+    ),
+    "BURK",
+)
+registerRenderer(DasdecRenderer(), "DAS", "DASDEC", "MONROE")
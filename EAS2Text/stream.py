@@ -0,0 +1,95 @@
+# Standard Library
+from io import TextIOBase
+from mmap import mmap
+from re import compile
+
+# Local Folder
+from .batch import decodeOne
+
+## ZCZC-ORG-EEE-PSSCCC(-PSSCCC x30)+TTTT-JJJHHMM-LLLLLLLL- or an NNNN EOM.
+## Takes whatever parser.HEADER takes (any callsign length), plus headers cut
+## off at a line break after JJJHHMM- so the parser can report them. A run of
+## Ns is one EOM.
+HEADER = compile(
+    rb"ZCZC-[^-+\r\n]{3}-[^-+\r\n]{3}-\d{6}(?:-\d{6}){0,30}"
+    rb"\+\d{4}-\d{7}-[^-+\r\n]*(?:-|(?=[\r\n]))|NNNN+"
+)
+MAX_HEADER = 1024  ## Longest header still put back together across chunks
+CHUNK_SIZE = 65536
+BUFFERS = (bytes, bytearray, memoryview, mmap)
+
+
+class HeaderScanner(object):
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def feed(self, chunk) -> list:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("latin-1", "replace")
+        buffer = self.buffer
+        buffer += chunk
+        headers = []
+        end = 0
+        for match in HEADER.finditer(buffer):
+            headers.append(match.group().decode("latin-1"))
+            end = match.end()
+
+        ## Keep only what could still turn into a header on the next chunk
+        tail = buffer.rfind(b"ZCZC", end)
+        if tail == -1 or len(buffer) - tail > MAX_HEADER:
+            tail = max(end, len(buffer) - 3)
+        del buffer[:tail]
+        return headers
+
+
+def __chunks__(source, chunkSize: int):
+    ## Hand on whatever is available right away, pipes may never close
+    if isinstance(source, str):
+        yield source
+        return
+    if isinstance(source, TextIOBase) and hasattr(source, "buffer"):
+        source = source.buffer  ## e.g. sys.stdin, its read() waits for more
+    if hasattr(source, "readinto1"):
+        buffer = bytearray(chunkSize)
+        view = memoryview(buffer)
+        while True:
+            size = source.readinto1(buffer)
+            if not size:
+                break
+            yield view[:size]
+    elif hasattr(source, "read1"):
+        while True:
+            chunk = source.read1(chunkSize)
+            if not chunk:
+                break
+            yield chunk
+    elif hasattr(source, "read"):
+        ## Raw files and sockets return short reads on their own
+        while True:
+            chunk = source.read(chunkSize)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        yield from source
+
+
+def iterHeaders(source, chunkSize: int = CHUNK_SIZE):
+    if isinstance(source, BUFFERS):
+        ## Already addressable (mmap, memoryview...), scan it in place
+        for match in HEADER.finditer(source):
+            yield match.group().decode("latin-1")
+        return
+    scanner = HeaderScanner()
+    for chunk in __chunks__(source, chunkSize):
+        yield from scanner.feed(chunk)
+
+
+def decodeStream(
+    source,
+    timeZone: int = None,
+    mode: str = "NONE",
+    chunkSize: int = CHUNK_SIZE,
+):
+    for sameData in iterHeaders(source, chunkSize):
+        yield decodeOne(sameData, timeZone, mode)
@@ -0,0 +1,155 @@
+# Standard Library
+from collections import Counter, defaultdict
+
+# Local Folder
+from .tables import getTables
+
+NATIONAL = "000000"
+
+
+def __states__(tables) -> tuple:
+    ## SS codes in use, and "WI" -> "55" from the county name suffixes
+    suffixes = defaultdict(Counter)
+    for code, name in tables.SAME.items():
+        suffix = name.rsplit(", ", 1)[-1]
+        if len(suffix) == 2 and suffix.isalpha() and suffix.isupper():
+            suffixes[code[:2]][suffix] += 1
+    states = frozenset(code[:2] for code in tables.SAME)
+    abbreviations = {}
+    for state, counts in suffixes.items():
+        abbreviation = counts.most_common(1)[0][0]
+        abbreviations.setdefault(abbreviation, []).append(state)
+    return states, {
+        abbreviation: codes[0]
+        for abbreviation, codes in abbreviations.items()
+        if len(codes) == 1
+    }
+
+
+class SubscriberIndex(object):
+    def __init__(self) -> None:
+        self.__tables = getTables()
+        self.__states, self.__abbreviations = __states__(self.__tables)
+        self.__subscribers = {}  ## subscriber -> set of codes
+        self.__exact = defaultdict(set)  ## PSSCCC -> subscribers
+        ## Reference counts, a subscriber can hold several codes in one area
+        self.__counties = defaultdict(Counter)  ## SSCCC -> subscribers
+        self.__statewide = defaultdict(Counter)  ## SS -> subscribers
+        self.__national = set()
+
+    def normalize(self, code: str) -> str:
+        ## "WI", "55079", "055079", "155079", "055000" or "000000"
+        code = str(code).strip()
+        if code.upper() in self.__abbreviations:
+            return f"0{self.__abbreviations[code.upper()]}000"
+        if len(code) == 5:
+            code = f"0{code}"
+        if len(code) != 6 or not code.isdigit():
+            raise ValueError(f"Invalid FIPS code: {code}")
+        if code == NATIONAL:
+            return code
+        if code[3:] == "000":
+            if code[0] != "0" or code[1:3] not in self.__states:
+                raise ValueError(f"Unknown state code: {code}")
+        elif (
+            code[1:] not in self.__tables.SAME
+            or code[0] not in self.__tables.SUBDIV
+        ):
+            raise ValueError(f"Unknown FIPS code: {code}")
+        return code
+
+    def subscribe(self, subscriber, codes) -> None:
+        if isinstance(codes, str):
+            codes = [codes]
+        codes = [self.normalize(code) for code in codes]
+        current = self.__subscribers.setdefault(subscriber, set())
+        for code in codes:
+            if code in current:
+                continue
+            current.add(code)
+            self.__exact[code].add(subscriber)
+            if code == NATIONAL:
+                self.__national.add(subscriber)
+                continue
+            if code[3:] != "000":
+                self.__counties[code[1:]][subscriber] += 1
+            self.__statewide[code[1:3]][subscriber] += 1
+
+    def unsubscribe(self, subscriber, codes=None) -> None:
+        ## Without codes, drops the subscriber entirely
+        current = self.__subscribers.get(subscriber)
+        if current is None:
+            return
+        if codes is None:
+            codes = list(current)
+        elif isinstance(codes, str):
+            codes = [self.normalize(codes)]
+        else:
+            codes = [self.normalize(code) for code in codes]
+        for code in codes:
+            if code not in current:
+                continue
+            current.discard(code)
+            self.__drop__(self.__exact, code, subscriber)
+            if code == NATIONAL:
+                self.__national.discard(subscriber)
+                continue
+            if code[3:] != "000":
+                self.__release__(self.__counties, code[1:], subscriber)
+            self.__release__(self.__statewide, code[1:3], subscriber)
+        if not current:
+            del self.__subscribers[subscriber]
+
+    @staticmethod
+    def __drop__(index, key, subscriber) -> None:
+        members = index[key]
+        members.discard(subscriber)
+        if not members:
+            del index[key]
+
+    @staticmethod
+    def __release__(index, key, subscriber) -> None:
+        members = index[key]
+        members[subscriber] -= 1
+        if members[subscriber] <= 0:
+            del members[subscriber]
+        if not members:
+            del index[key]
+
+    def match(self, alert) -> set:
+        ## Accepts an alert (anything with .FIPS) or a list of FIPS codes
+        FIPS = getattr(alert, "FIPS", alert)
+        if isinstance(FIPS, str):
+            FIPS = [FIPS]
+        if not FIPS or getattr(alert, "EOM", False):
+            return set()  ## An EOM (NNNN) isn't for anyone in particular
+        exact = self.__exact
+        matched = set(self.__national)
+        for code in FIPS:
+            code = code.strip()
+            if len(code) == 5:
+                code = f"0{code}"
+            if code == NATIONAL:
+                return set(self.__subscribers)
+            state = code[1:3]
+            if code[3:] == "000":
+                ## Statewide alert reaches everyone in the state
+                matched.update(self.__statewide.get(state, ()))
+                continue
+            matched.update(exact.get(f"0{state}000", ()))
+            if code[0] == "0":
+                ## Whole county, which includes all of its subdivisions
+                matched.update(self.__counties.get(code[1:], ()))
+            else:
+                matched.update(exact.get(code, ()))
+                matched.update(exact.get(f"0{code[1:]}", ()))
+        return matched
+
+    def subscriptions(self, subscriber) -> frozenset:
+        return frozenset(self.__subscribers.get(subscriber, ()))
+
+    def __contains__(self, subscriber) -> bool:
+        return subscriber in self.__subscribers
+
+    def __len__(self) -> int:
+        return len(self.__subscribers)
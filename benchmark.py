@@ -0,0 +1,227 @@
+# Standard Library
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from json import dump, load
+from random import Random
+from statistics import median
+from subprocess import run
+from time import perf_counter, perf_counter_ns
+
+# First-Party
+from EAS2Text import (
+    EAS2Text,
+    ParsedAlert,
+    decodeMany,
+    decodeRecords,
+    getTables,
+)
+
+MODES = ParsedAlert.MODES
+CORPUS_SIZE = 20000
+MEMORY_SCALE = 100000  ## Peak memory is reported per this many results
+IMPORT_RUNS = 5
+THRESHOLD = 0.10  ## Slowdown (10%) that counts as a regression
+
+## True when a bigger number is better
+METRICS = {
+    "decodesPerSec": True,
+    "p50": False,
+    "p99": False,
+    "recordMemory": False,
+    "objectMemory": False,
+    "importTime": False,
+}
+
+
+def __mangle__(rng: Random, header: str) -> str:
+    ## The kinds of damage a noisy receiver actually produces
+    kind = rng.randrange(4)
+    if kind == 0:
+        index = rng.randrange(len(header))
+        flipped = chr(ord(header[index]) ^ (1 << rng.randrange(7)))
+        return header[:index] + flipped + header[index + 1 :]
+    elif kind == 1:
+        return header[: rng.randrange(4, len(header))]
+    elif kind == 2:
+        return header.replace("+", "+9", 1)
+    return header.replace("ZCZC", "ZCZ", 1)
+
+
+def generateCorpus(
+    size: int = CORPUS_SIZE,
+    seed: int = 0,
+    malformed: float = 0.05,
+    eom: float = 0.05,
+) -> list:
+    ## Same seed, same corpus: valid headers from the real tables, with
+    ## 1 to 31 FIPS codes, some malformed variants and some NNNN EOMs
+    rng = Random(seed)
+    stats = getTables()
+    counties = sorted(stats.SAME)
+    subdivisions = sorted(stats.SUBDIV)
+    orgs = sorted(stats.ORGS)
+    events = sorted(stats.EVENTS)
+    corpus = []
+    for _ in range(size):
+        roll = rng.random()
+        if roll < eom:
+            corpus.append("NNNN")
+            continue
+        FIPS = "-".join(
+            rng.choice(subdivisions) + rng.choice(counties)
+            for _ in range(rng.randint(1, 31))
+        )
+        header = "ZCZC-%s-%s-%s+%02d%s-%03d%02d%02d-%-8s-" % (
+            rng.choice(orgs),
+            rng.choice(events),
+            FIPS,
+            rng.randrange(7),
+            rng.choice(["00", "15", "30", "45"]),
+            rng.randint(1, 365),
+            rng.randrange(24),
+            rng.randrange(60),
+            "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ/") for _ in "WACN"),
+        )
+        if roll < eom + malformed:
+            header = __mangle__(rng, header)
+        corpus.append(header)
+    return corpus
+
+
+def __percentile__(samples: list, fraction: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def benchMode(corpus: list, mode: str, timeZone: int = 0) -> dict:
+    latencies = []
+    started = perf_counter()
+    for sameData in corpus:
+        begin = perf_counter_ns()
+        try:
+            EAS2Text(sameData, timeZone=timeZone, mode=mode)
+        except Exception:
+            pass
+        latencies.append(perf_counter_ns() - begin)
+    elapsed = perf_counter() - started
+    latencies.sort()
+    return {
+        "decodesPerSec": len(corpus) / elapsed,
+        "p50": __percentile__(latencies, 0.50) / 1000.0,  ## Microseconds
+        "p99": __percentile__(latencies, 0.99) / 1000.0,
+    }
+
+
+def benchMemory(corpus: list, timeZone: int = 0) -> dict:
+    ## Peak MB while holding every result, scaled to MEMORY_SCALE results
+    results = {}
+    for name, decode in (
+        ("recordMemory", decodeRecords),
+        ("objectMemory", decodeMany),
+    ):
+        tracemalloc.start()
+        kept = decode(corpus, timeZone=timeZone)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results[name] = peak * MEMORY_SCALE / len(kept) / 1e6
+        del kept
+    return results
+
+
+def benchImport(runs: int = IMPORT_RUNS) -> dict:
+    ## Fresh interpreter each time, only the import itself is timed
+    script = (
+        "from time import perf_counter; started = perf_counter(); "
+        "import EAS2Text; print(perf_counter() - started)"
+    )
+    times = []
+    for _ in range(runs):
+        output = run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        times.append(float(output.stdout))
+    return {"importTime": median(times) * 1000.0}  ## Milliseconds
+
+
+def runBenchmarks(
+    size: int = CORPUS_SIZE, seed: int = 0, modes=MODES, imports: bool = True
+) -> dict:
+    corpus = generateCorpus(size, seed)
+    decodeMany(corpus[:100], timeZone=0)  ## Warm up tables and caches
+    results = {
+        "corpus": {"size": size, "seed": seed},
+        "modes": {mode: benchMode(corpus, mode) for mode in modes},
+    }
+    results.update(benchMemory(corpus))
+    if imports:
+        results.update(benchImport())
+    return results
+
+
+def __metrics__(results: dict):
+    for mode, metrics in results.get("modes", {}).items():
+        for metric, value in metrics.items():
+            yield f"{mode} {metric}", metric, value
+    for metric in METRICS:
+        if metric in results:
+            yield metric, metric, results[metric]
+
+
+def compare(baseline: dict, current: dict, threshold: float = THRESHOLD):
+    ## (name, baseline, current, change, regressed) for every shared metric
+    old = {name: value for name, _, value in __metrics__(baseline)}
+    report = []
+    for name, metric, value in __metrics__(current):
+        if name not in old:
+            continue
+        change = (value - old[name]) / old[name] if old[name] else 0.0
+        worse = -change if METRICS[metric] else change
+        report.append((name, old[name], value, change, worse > threshold))
+    return report
+
+
+def printReport(report, file=sys.stdout) -> None:
+    print(
+        f"{'metric':<28}{'baseline':>14}{'current':>14}{'change':>10}",
+        file=file,
+    )
+    for name, old, new, change, regressed in report:
+        print(
+            f"{name:<28}{old:>14.2f}{new:>14.2f}{change:>+10.1%}"
+            + ("  REGRESSION" if regressed else ""),
+            file=file,
+        )
+
+
+def main(argv=None) -> int:
+    parser = ArgumentParser(description="EAS2Text decode benchmarks")
+    parser.add_argument("--size", type=int, default=CORPUS_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", action="append", dest="modes")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON to compare with")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--no-import", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = runBenchmarks(
+        args.size, args.seed, args.modes or MODES, not args.no_import
+    )
+    if args.save:
+        with open(args.save, "w") as output:
+            dump(results, output, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline:
+            report = compare(load(baseline), results, args.threshold)
+        printReport(report)
+        return 1 if any(row[4] for row in report) else 0
+    for name, _, value in __metrics__(results):
+        print(f"{name:<28}{value:>14.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
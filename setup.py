@@ -19,6 +19,8 @@ setup(
     author_email="acrn@gwes-eas.network",
     license="ODbL-1.0",
     install_requires=[],
+    python_requires=">=3.7",
+    entry_points={"console_scripts": ["eas2text=EAS2Text.cli:main"]},
     long_description=README,
     long_description_content_type="text/markdown",
     url="https://github.com/A-c0rN/EAS2Text",
@@ -27,7 +29,6 @@ setup(
         "Development Status :: 5 - Production/Stable",
         "License :: Other/Proprietary License",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -1,8 +1,52 @@
 # Standard Library
+import asyncio
+import io
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 # First-Party
-from EAS2Text import EAS2Text
+from benchmark import compare, generateCorpus
+from EAS2Text import (
+    AlertRecord,
+    BurstReconciler,
+    Clock,
+    DecodeCache,
+    EAS2Text,
+    HeaderScanner,
+    Instruments,
+    InvalidSAME,
+    MissingSAME,
+    ParsedAlert,
+    Renderer,
+    SubscriberIndex,
+    addOverrides,
+    decodeAsync,
+    decodeBursts,
+    decodeMany,
+    decodeParallel,
+    decodeRecords,
+    decodeStream,
+    disableInstrumentation,
+    enableInstrumentation,
+    getClock,
+    getTables,
+    isValid,
+    iterHeaders,
+    reconcile,
+    reconcileStream,
+    registerRenderer,
+    resetTables,
+    validate,
+)
+from EAS2Text.cli import main
+from EAS2Text.stream import MAX_HEADER
 
 
 class TestEAS2Text(unittest.TestCase):
@@ -64,5 +108,808 @@ class TestEAS2Text(unittest.TestCase):
         )
 
 
+class TestTables(unittest.TestCase):
+    def tearDown(self):
+        resetTables()
+
+    def testTablesShared(self):
+        self.assertIs(getTables(), getTables(), "Tables Parsed Twice!")
+
+    def testTablesReadOnly(self):
+        with self.assertRaises(TypeError):
+            getTables().SAME["55079"] = "Nowhere"
+
+    def testOverrides(self):
+        addOverrides({"SAME": {"55079": "Brew City, WI"}})
+        self.assertEqual(
+            getTables().SAME["55079"], "Brew City, WI", "Override Ignored!"
+        )
+        self.assertEqual(
+            EAS2Text("ZCZC-EAS-RWT-055079+0015-0012345-SOFTTEST-").FIPSText,
+            ["Brew City, WI"],
+            "Override Not Used In Decode!",
+        )
+        resetTables()
+        self.assertEqual(
+            getTables().SAME["55079"], "Milwaukee County, WI", "Reset Failed!"
+        )
+
+
+class TestDecodeMany(unittest.TestCase):
+    def testOrderAndErrors(self):
+        headers = [
+            "ZCZC-EAS-RWT-055079+0015-0012345-SOFTTEST-",
+            "",
+            "NNNN",
+            "ZCZC-EAS-RWT-05507+0015-0012345-SOFTTEST-",
+            "ZCZC-WXR-TOR-055079+0030-0012345-SOFTTEST-",
+        ]
+        results = decodeMany(headers, timeZone=-6, mode="TFT")
+        self.assertEqual(
+            [i.sameData for i in results], headers, "Results Out Of Order!"
+        )
+        self.assertIsInstance(results[1].error, MissingSAME)
+        self.assertIsInstance(results[3].error, InvalidSAME)
+        self.assertEqual(results[2].alert.EASText, "End Of Message")
+        for i in (0, 4):
+            self.assertIsNone(results[i].error, "Valid Header Failed!")
+            self.assertEqual(
+                results[i].alert.EASText,
+                EAS2Text(headers[i], timeZone=-6, mode="TFT").EASText,
+                "Batch Decode Differs From EAS2Text!",
+            )
+
+
+class TestStream(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.headers = [
+            "ZCZC-WXR-SPS-024043-024021+0600-0231829-WACN    -",
+            "NNNN",
+            "ZCZC-EAS-RWT-055079+0015-0012345-KABC/FM -",
+        ]
+        cls.raw = b"EAS: %s\r\nnoise ZCZC-XX\nEAS: %s\n%s" % tuple(
+            i.encode() for i in cls.headers
+        )
+
+    def testChunkBoundaries(self):
+        for size in (1, 2, 5, 64):
+            scanner = HeaderScanner()
+            found = []
+            for i in range(0, len(self.raw), size):
+                found += scanner.feed(self.raw[i : i + size])
+            self.assertEqual(found, self.headers, f"Chunk Size {size} Failed!")
+
+    def testSources(self):
+        for source in (
+            memoryview(self.raw),
+            io.BytesIO(self.raw),
+            io.StringIO(self.raw.decode()),
+            [self.raw[:30], self.raw[30:]],
+        ):
+            self.assertEqual(list(iterHeaders(source)), self.headers)
+
+    def testFramingMatchesParser(self):
+        ## Anything EAS2Text decodes has to make it out of the stream, and
+        ## a header cut off at the line end is framed so its error shows up
+        raw = (
+            b"ZCZC-EAS-RWT-055079+0015-0012345-KABC/NWS1-\n"
+            b"NNNNNNNN\n"
+            b"ZCZC-EAS-RWT-055079+0015-0012345-KABC\r\n"
+        )
+        results = list(decodeStream(io.BytesIO(raw), timeZone=0))
+        self.assertEqual(results[0].alert.callsign, "KABC/NWS1")
+        self.assertEqual(results[1].alert.EASText, "End Of Message")
+        self.assertEqual(results[2].error.code, "CALLSIGN")
+        self.assertEqual(len(results), 3)
+
+    def testBoundedBuffer(self):
+        scanner = HeaderScanner()
+        scanner.feed(b"ZCZC-" + b"x" * (MAX_HEADER + 1))
+        self.assertLessEqual(len(scanner.buffer), 3, "Buffer Not Bounded!")
+
+    def testOpenPipe(self):
+        ## Headers have to come out while the writer is still connected
+        read, write = os.pipe()
+        found = []
+        with open(read, "rb") as source, open(write, "wb") as sink:
+            reader = threading.Thread(
+                target=lambda: found.extend(iterHeaders(source))
+            )
+            reader.start()
+            sink.write(self.raw[:60])
+            sink.flush()
+            for _ in range(100):
+                if found:
+                    break
+                time.sleep(0.05)
+            self.assertEqual(found, self.headers[:1])
+            sink.write(self.raw[60:])
+            sink.close()
+            reader.join(5)
+        self.assertEqual(found, self.headers)
+
+    def testDecodeStream(self):
+        results = list(decodeStream(io.BytesIO(self.raw), timeZone=0))
+        self.assertEqual(results[1].alert.EASText, "End Of Message")
+        self.assertEqual(results[2].alert.callsign, "KABC/FM")
+
+
+class TestParallel(unittest.TestCase):
+    def testParallelDecode(self):
+        headers = [
+            "ZCZC-EAS-RWT-055079+0015-0012345-SOFTTEST-",
+            "ZCZC-EAS-RWT-05507+0015-0012345-SOFTTEST-",
+            "NNNN",
+        ] * 20
+        for ordered in (True, False):
+            results = list(
+                decodeParallel(
+                    headers,
+                    timeZone=0,
+                    workers=2,
+                    chunkSize=7,
+                    ordered=ordered,
+                )
+            )
+            self.assertEqual(len(results), len(headers))
+            if ordered:
+                self.assertEqual([i.sameData for i in results], headers)
+            for i in results:
+                if i.sameData.startswith("ZCZC-EAS-RWT-05507+"):
+                    self.assertIsInstance(i.error, InvalidSAME)
+                else:
+                    self.assertIsInstance(i.alert, AlertRecord)
+
+    def testRecordPickles(self):
+        record = AlertRecord.fromAlert(
+            EAS2Text("ZCZC-EAS-RWT-055079+0015-0012345-SOFTTEST-")
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+        self.assertEqual(record.FIPS, ("055079",))
+
+
+class TestAsync(unittest.TestCase):
+    headers = [
+        b"ZCZC-EAS-RWT-055079+0015-0012345-SOFTTEST-",
+        b"NNNN",
+        b"ZCZC-WXR-TOR-05507+0030-0012345-SOFTTEST-",
+        b"ZCZC-WXR-TOR-055079+0030-0012345-SOFTTEST-",
+    ]
+
+    def testLazyImport(self):
+        ## Plain decoding must not pay for asyncio / multiprocessing
+        loaded = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, EAS2Text; "
+                "print('asyncio' in sys.modules, "
+                "'multiprocessing' in sys.modules)",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        self.assertEqual(loaded, ["False", "False"])
+
+    async def decodeFromServer(self, **kwargs):
+        async def relay(reader, writer):
+            ## Trickle the headers out in small pieces, like an ENDEC relay
+            data = b"\r\n".join(self.headers) + b"\r\n"
+            for i in range(0, len(data), 9):
+                writer.write(data[i : i + 9])
+                await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(relay, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            results = [
+                i async for i in decodeAsync(reader, timeZone=0, **kwargs)
+            ]
+            writer.close()
+        return results
+
+    def testStreamReader(self):
+        with ThreadPoolExecutor(1) as executor:
+            offloaded = {"queueSize": 1, "executor": executor}
+            for kwargs in ({}, offloaded, {"inline": True}):
+                results = asyncio.run(self.decodeFromServer(**kwargs))
+                self.assertEqual(
+                    [i.sameData.encode() for i in results],
+                    [i for i in self.headers if b"05507+" not in i],
+                )
+                self.assertEqual(results[1].alert.EASText, "End Of Message")
+
+    def testAsyncIterator(self):
+        async def chunks():
+            for i in self.headers:
+                yield i
+
+        async def collect():
+            return [i async for i in decodeAsync(chunks(), mode="TFT")]
+
+        results = asyncio.run(collect())
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].alert.evnt, "RWT")
+
+
+class TestDecodeCache(unittest.TestCase):
+    header = "ZCZC-EAS-RWT-055079+0015-0012345-SOFTTEST-"
+
+    def testHitsAndShared(self):
+        cache = DecodeCache(maxSize=4)
+        first = cache.decode(self.header, timeZone=0)
+        self.assertIs(cache.decode(self.header, timeZone=0), first)
+        self.assertIsNot(
+            cache.decode(self.header, timeZone=0, mode="TFT"), first
+        )
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def testEviction(self):
+        cache = DecodeCache(maxSize=2)
+        for timeZone in (0, 1, 2, 0):
+            cache.decode(self.header, timeZone=timeZone)
+        stats = cache.stats()
+        self.assertEqual((stats["size"], stats["evictions"]), (2, 2))
+        self.assertEqual(stats["hits"], 0, "Evicted Entry Was Hit!")
+
+    def testExpiry(self):
+        cache = DecodeCache(ttl=0)
+        cache.decode(self.header)
+        cache.decode(self.header)
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def testErrorsCached(self):
+        cache = DecodeCache()
+        for i in range(2):
+            with self.assertRaises(MissingSAME):
+                cache.decode("  ")
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def testFreshErrors(self):
+        ## Every caller gets its own exception, nothing shared to mutate
+        cache = DecodeCache()
+        header = "ZCZC-EAS-RWT-055079+0075-0012345-SOFTTEST-"
+        errors = []
+        for i in range(2):
+            with self.assertRaises(InvalidSAME) as context:
+                cache.decode(header)
+            errors.append(context.exception)
+        self.assertIsNot(errors[0], errors[1])
+        self.assertEqual(
+            [(error.code, error.offset, str(error)) for error in errors],
+            [("PURGE", 20, str(errors[0]))] * 2,
+        )
+
+
+class TestParsedAlert(unittest.TestCase):
+    header = "ZCZC-CIV-CAE-055079-155079+0100-0012345-SOFTTEST-"
+
+    ## strFIPS, startTimeText, endTimeText and EASText from the original
+    ## implementation, at timeZone=-6 in 2026
+    clock = Clock(6 * 3600, 2026, 290, "CST", None, 0)
+    expected = {
+        "NONE": (
+            "Milwaukee County, WI; and Northwest Milwaukee County, WI;",
+            "05:45 PM",
+            "06:45 PM",
+            "A Civil Authority has issued a Child Abduction Emergency for Milwaukee County, WI; and Northwest Milwaukee County, WI; beginning at 05:45 PM and ending at 06:45 PM. Message from SOFTTEST.",
+        ),
+        "TFT": (
+            "Milwaukee County WI, and Northwest Milwaukee County WI",
+            "05:45 PM ON Jan 01, 2026",
+            "06:45 PM",
+            "A CIVIL AUTHORITY HAS ISSUED A CHILD ABDUCTION EMERGENCY FOR THE FOLLOWING COUNTIES/AREAS: MILWAUKEE COUNTY WI, AND NORTHWEST MILWAUKEE COUNTY WI AT 05:45 PM ON JAN 01, 2026 EFFECTIVE UNTIL 06:45 PM. MESSAGE FROM SOFTTEST.",
+        ),
+        "SAGE EAS": (
+            "Milwaukee County, WI, and Northwest Milwaukee County, WI",
+            "05:45 pm",
+            "06:45 pm",
+            "The Civil Authorities have issued a Child Abduction Emergency for Milwaukee County, WI, and Northwest Milwaukee County, WI beginning at 05:45 pm and ending at 06:45 pm (SOFTTEST)",
+        ),
+        "SAGE DIGITAL": (
+            "Milwaukee County, WI, and Northwest Milwaukee County, WI",
+            "05:45 pm",
+            "06:45 pm",
+            "The Civil Authorities have issued a Child Abduction Emergency for Milwaukee County, WI, and Northwest Milwaukee County, WI beginning at 05:45 pm and ending at 06:45 pm (SOFTTEST)",
+        ),
+        "TRILITHIC": (
+            "Milwaukee County WI - Northwest Milwaukee County WI",
+            "",
+            "01/01/26 18:45:00 CST",
+            "Civil Authorities have issued a Child Abduction Emergency for the following counties: Milwaukee County WI - Northwest Milwaukee County WI. Effective Until 01/01/26 18:45:00 CST. (SOFTTEST)",
+        ),
+        "BURK": (
+            "Milwaukee County WI, and Northwest Milwaukee County WI",
+            "JANUARY 01, 2026 at 05:45 PM",
+            "06:45 PM, January 01, 2026",
+            "Civil Authorities has issued CHILD ABDUCTION EMERGENCY for the following counties/areas: Milwaukee County WI, and Northwest Milwaukee County WI on JANUARY 01, 2026 at 05:45 PM effective until 06:45 PM, January 01, 2026.",
+        ),
+        "DASDEC": (
+            "Milwaukee County, WI; and Northwest Milwaukee County, WI;",
+            "05:45 PM ON JAN 01, 2026",
+            "06:45 PM JAN 01, 2026",
+            "A CIVIL AUTHORITY HAS ISSUED A CHILD ABDUCTION EMERGENCY FOR THE FOLLOWING COUNTIES/AREAS: Milwaukee County, WI; and Northwest Milwaukee County, WI; AT 05:45 PM ON JAN 01, 2026 EFFECTIVE UNTIL 06:45 PM JAN 01, 2026. MESSAGE FROM SOFTTEST.",
+        ),
+    }
+
+    def testRenderModes(self):
+        alert = ParsedAlert.__fromClock__(self.header, self.clock)
+        for mode, expected in self.expected.items():
+            rendering = alert.render(mode)
+            self.assertEqual(
+                (
+                    rendering.strFIPS,
+                    rendering.startTimeText,
+                    rendering.endTimeText,
+                    rendering.EASText,
+                ),
+                expected,
+                mode,
+            )
+
+    def testRenderCached(self):
+        alert = ParsedAlert(self.header)
+        self.assertIs(alert.render("TFT"), alert.render("TFT"))
+        self.assertEqual(alert.orgText, "A Civil Authority", "Base Mutated!")
+
+    def testEOM(self):
+        self.assertEqual(ParsedAlert("NNNN").text("BURK"), "End Of Message")
+
+
+class TestRenderers(unittest.TestCase):
+    def testCustomMode(self):
+        registerRenderer(
+            Renderer(
+                template="{evntText} ({strFIPS}) via {orgText}, {callsign}",
+                orgOverrides={"EAS": "WXYZ"},
+                fipsSeparator=" / ",
+                fipsTerminator="",
+            ),
+            "HOUSE",
+        )
+        alert = EAS2Text(
+            "ZCZC-EAS-RWT-055079-055133+0015-0012345-SOFTTEST-", mode="HOUSE"
+        )
+        self.assertEqual(
+            alert.EASText,
+            "a Required Weekly Test (Milwaukee County, WI / "
+            "and Waukesha County, WI) via WXYZ, SOFTTEST",
+        )
+
+    def testSageFallback(self):
+        header = "ZCZC-CIV-CAE-055079+0100-0012345-SOFTTEST-"
+        self.assertEqual(
+            EAS2Text(header, timeZone=0, mode="SAGE 3644").EASText,
+            EAS2Text(header, timeZone=0, mode="SAGE EAS").EASText,
+        )
+
+
+class TestGolden(unittest.TestCase):
+    ## EASText from the original implementation (timeZone=0, in 2026), except
+    ## TRILITHIC, which used to mangle "Maryland" and "Highland" into
+    ## "Maryl-" and "Highl"
+    clock = Clock(0, 2026, 290, "UTC", None, 0)
+    headers = [
+        "ZCZC-WXR-SPS-024000-024003-051091+0600-0231829-WACN    -",
+        "ZCZC-CIV-CAE-000000+0100-1201200-KABC/FM -",
+        "ZCZC-EAS-EAN-055079-155079+0030-2002350-SOFTTEST-",
+    ]
+    expected = {
+        "NONE": [
+            "The National Weather Service has issued a Special Weather Statement for State of Maryland; Anne Arundel, MD; and Highland County, VA; beginning at 06:29 PM January 23 and ending at 12:29 AM January 24. Message from WACN.",
+            "A Civil Authority has issued a Child Abduction Emergency for All of The United States; beginning at 12:00 PM and ending at 01:00 PM. Message from KABC/FM.",
+            "An EAS Participant has issued a National Emergency Action Notification for Milwaukee County, WI; and Northwest Milwaukee County, WI; beginning at 11:50 PM July 19 and ending at 12:20 AM July 20. Message from SOFTTEST.",
+        ],
+        "TFT": [
+            "THE NATIONAL WEATHER SERVICE HAS ISSUED A SPECIAL WEATHER STATEMENT FOR THE FOLLOWING COUNTIES/AREAS: STATE OF MARYLAND, ANNE ARUNDEL MD, AND HIGHLAND COUNTY VA AT 06:29 PM ON JAN 23, 2026 EFFECTIVE UNTIL 12:29 AM ON JAN 24, 2026. MESSAGE FROM WACN.",
+            "A CIVIL AUTHORITY HAS ISSUED A CHILD ABDUCTION EMERGENCY FOR THE FOLLOWING COUNTIES/AREAS: ALL OF THE UNITED STATES AT 12:00 PM ON APR 30, 2026 EFFECTIVE UNTIL 01:00 PM. MESSAGE FROM KABC/FM.",
+            "A NATIONAL EMERGENCY ACTION NOTIFICATION HAS BEEN ISSUED FOR THE FOLLOWING COUNTIES/AREAS: MILWAUKEE COUNTY WI, AND NORTHWEST MILWAUKEE COUNTY WI AT 11:50 PM ON JUL 19, 2026 EFFECTIVE UNTIL 12:20 AM ON JUL 20, 2026. MESSAGE FROM SOFTTEST.",
+        ],
+        "SAGE EAS": [
+            "The National Weather Service has issued a Special Weather Statement for State of Maryland, Anne Arundel, MD, and Highland County, VA beginning at 06:29 pm Fri Jan 23 and ending at 12:29 am Sat Jan 24 (WACN)",
+            "The Civil Authorities have issued a Child Abduction Emergency for All of The United States beginning at 12:00 pm and ending at 01:00 pm (KABC/FM)",
+            "A Broadcast station or cable system has issued a National Emergency Action Notification for Milwaukee County, WI, and Northwest Milwaukee County, WI beginning at 11:50 pm Sun Jul 19 and ending at 12:20 am Mon Jul 20 (SOFTTEST)",
+        ],
+        "SAGE DIGITAL": [
+            "The National Weather Service has issued a Special Weather Statement for State of Maryland, Anne Arundel, MD, and Highland County, VA beginning at 06:29 pm Fri Jan 23 and ending at 12:29 am Sat Jan 24 (WACN)",
+            "The Civil Authorities have issued a Child Abduction Emergency for All of The United States beginning at 12:00 pm and ending at 01:00 pm (KABC/FM)",
+            "An EAS Participant has issued a National Emergency Action Notification for Milwaukee County, WI, and Northwest Milwaukee County, WI beginning at 11:50 pm Sun Jul 19 and ending at 12:20 am Mon Jul 20 (SOFTTEST)",
+        ],
+        "TRILITHIC": [
+            "The National Weather Service has issued a Special Weather Statement for the following counties: State of Maryland - Anne Arundel MD - Highland County VA. Effective Until 01/24/26 00:29:00 UTC. (WACN)",
+            "Civil Authorities have issued a Child Abduction Emergency for The United States. Effective Until 04/30/26 13:00:00 UTC. (KABC/FM)",
+            "An EAS Participant has issued a National Emergency Action Notification for the following counties: Milwaukee County WI - Northwest Milwaukee County WI. Effective Until 07/20/26 00:20:00 UTC. (SOFTTEST)",
+        ],
+        "BURK": [
+            "National Weather Service has issued SPECIAL WEATHER STATEMENT for the following counties/areas: State of Maryland, Anne Arundel MD, and Highland County VA on JANUARY 23, 2026 at 06:29 PM effective until 12:29 AM, January 24, 2026.",
+            "Civil Authorities has issued CHILD ABDUCTION EMERGENCY for the following counties/areas: All of The United States on APRIL 30, 2026 at 12:00 PM effective until 01:00 PM, April 30, 2026.",
+            "A Broadcast station or cable system has issued NATIONAL EMERGENCY ACTION NOTIFICATION for the following counties/areas: Milwaukee County WI, and Northwest Milwaukee County WI on JULY 19, 2026 at 11:50 PM effective until 12:20 AM, July 20, 2026.",
+        ],
+        "DASDEC": [
+            "THE NATIONAL WEATHER SERVICE HAS ISSUED A SPECIAL WEATHER STATEMENT FOR THE FOLLOWING COUNTIES/AREAS: State of Maryland; Anne Arundel, MD; and Highland County, VA; AT 06:29 PM ON JAN 23, 2026 EFFECTIVE UNTIL 12:29 AM JAN 24, 2026. MESSAGE FROM WACN.",
+            "A CIVIL AUTHORITY HAS ISSUED A CHILD ABDUCTION EMERGENCY FOR THE FOLLOWING COUNTIES/AREAS: All of The United States; AT 12:00 PM ON APR 30, 2026 EFFECTIVE UNTIL 01:00 PM APR 30, 2026. MESSAGE FROM KABC/FM.",
+            "AN EAS PARTICIPANT HAS ISSUED A NATIONAL EMERGENCY ACTION NOTIFICATION FOR THE FOLLOWING COUNTIES/AREAS: Milwaukee County, WI; and Northwest Milwaukee County, WI; AT 11:50 PM ON JUL 19, 2026 EFFECTIVE UNTIL 12:20 AM JUL 20, 2026. MESSAGE FROM SOFTTEST.",
+        ],
+    }
+    aliases = {
+        "VIAVI": "TRILITHIC",
+        "EASY": "TRILITHIC",
+        "DAS": "DASDEC",
+        "MONROE": "DASDEC",
+    }
+
+    def testModes(self):
+        for mode, expected in self.expected.items():
+            for header, text in zip(self.headers, expected):
+                alert = EAS2Text.__fromClock__(header, mode, self.clock)
+                self.assertEqual(alert.EASText, text, f"{mode}: {header}")
+
+    def testAliases(self):
+        for alias, mode in self.aliases.items():
+            for header, text in zip(self.headers, self.expected[mode]):
+                alert = EAS2Text.__fromClock__(header, alias, self.clock)
+                self.assertEqual(alert.EASText, text, f"{alias}: {header}")
+
+
+class TestAlertRecord(unittest.TestCase):
+    header = "ZCZC-WXR-SPS-024043-024021+0600-0231829-WACN    -"
+
+    def testMatchesEAS2Text(self):
+        for header in (self.header, "NNNN"):
+            for mode in ("NONE", "TRILITHIC"):
+                self.assertEqual(
+                    AlertRecord.fromParsed(ParsedAlert(header, 0), mode),
+                    AlertRecord.fromAlert(EAS2Text(header, 0, mode)),
+                )
+
+    def testCompact(self):
+        record = decodeRecords([self.header], timeZone=0)[0].alert
+        self.assertFalse(hasattr(record, "__dict__"), "Record Has __dict__!")
+        with self.assertRaises(AttributeError):
+            record.org = "CIV"
+
+    def testSerialization(self):
+        record = AlertRecord.fromAlert(EAS2Text(self.header, timeZone=0))
+        self.assertEqual(record.toDict()["FIPS"], ("024043", "024021"))
+        self.assertEqual(AlertRecord.fromJSON(record.toJSON()), record)
+        row = record.toCSVRow()
+        self.assertEqual(len(row), len(AlertRecord._fields))
+        self.assertEqual(row[3], "024043|024021")
+        self.assertEqual(row[8], record.startTime.isoformat())
+
+
+class TestValidate(unittest.TestCase):
+    def testValid(self):
+        for header in (
+            "ZCZC-EAS-RWT-055079+0015-0012345-SOFTTEST-",
+            "  ZCZC-EAS-RWT-055079-155079+0015-0012345-KABC/FM -\n",
+            "NNNN",
+        ):
+            self.assertTrue(isValid(header), header)
+
+    def testErrorCodes(self):
+        for header, code, offset in (
+            ("", "MISSING", 0),
+            ("ZXZC-EAS-RWT-055079+0015-0012345-SOFTTEST-", "NO_START", 0),
+            ("ZCZC-EASY-RWT-055079+0015-0012345-SOFTTEST-", "ORIGINATOR", 5),
+            ("ZCZC-EAS-RW-055079+0015-0012345-SOFTTEST-", "EVENT", 9),
+            ("ZCZC-EAS-RWT-055079-5507+0015-0012345-SOFTTEST-", "FIPS", 20),
+            ("ZCZC-EAS-RWT+0015-0012345-SOFTTEST-", "FIPS_COUNT", 12),
+            ("ZCZC-EAS-RWT-055079+0075-0012345-SOFTTEST-", "PURGE", 20),
+            ("ZCZC-EAS-RWT-055079+0015-3672345-SOFTTEST-", "TIMESTAMP", 25),
+            ("ZCZC-EAS-RWT-055079+0015-0012345-SOFTTEST", "CALLSIGN", 33),
+        ):
+            result = validate(header)
+            self.assertFalse(result.valid, header)
+            self.assertEqual((result.code, result.offset), (code, offset))
+
+    def testLeapDay(self):
+        header = "ZCZC-EAS-RWT-055079+0015-3661200-SOFTTEST-"
+        leap = Clock(0, 2025, 10, "UTC", None, 0)  ## Dec 31, 2024
+        common = Clock(0, 2026, 300, "UTC", None, 0)
+        self.assertTrue(isValid(header, leap))
+        self.assertEqual(
+            validate(header, common)[:3], (False, "TIMESTAMP", 25)
+        )
+        with self.assertRaises(InvalidSAME):
+            EAS2Text.__fromClock__(header, "NONE", common)
+        try:  ## Whatever this year is, the fast path has to agree
+            EAS2Text(header)
+        except InvalidSAME:
+            self.assertFalse(isValid(header))
+        else:
+            self.assertTrue(isValid(header))
+
+    def testInvalidSAMECode(self):
+        with self.assertRaises(InvalidSAME) as context:
+            EAS2Text("ZCZC-EAS-RWT-055079+0015-0012345-SOFTTEST")
+        self.assertEqual(context.exception.code, "CALLSIGN")
+        self.assertEqual(context.exception.offset, 33)
+        error = pickle.loads(pickle.dumps(context.exception))
+        self.assertEqual((error.code, error.offset), ("CALLSIGN", 33))
+
+
+class TestClock(unittest.TestCase):
+    header = "ZCZC-WXR-TOR-055079+0130-%s-SOFTTEST-"
+
+    def alert(self, timeStamp, year=2026, yearDay=365, **kwargs):
+        fields = dict(dtOffset=0, tzName="UTC", zone=None, minute=0)
+        fields.update(kwargs)
+        clock = Clock(year=year, yearDay=yearDay, **fields)
+        return ParsedAlert.__fromClock__(self.header % timeStamp, clock)
+
+    def testLeapYear(self):
+        alert = self.alert("0601200", year=2024)
+        self.assertEqual(str(alert.startTime), "2024-02-29 12:00:00")
+        self.assertEqual(str(alert.endTime), "2024-02-29 13:30:00")
+        with self.assertRaises(InvalidSAME):
+            self.alert("3661200", year=2026)
+
+    def testYearRollover(self):
+        late = self.alert("3652330", year=2027, yearDay=1)
+        self.assertEqual(str(late.startTime), "2026-12-31 23:30:00")
+        self.assertEqual(str(late.endTime), "2027-01-01 01:00:00")
+        early = self.alert("0010030", year=2026, yearDay=365)
+        self.assertEqual(early.startTime.year, 2027)
+
+    def testArchivedHeader(self):
+        ## January headers decoded in December stay in the same year
+        january = self.alert("0201200", year=2026, yearDay=335)
+        self.assertEqual(str(january.startTime), "2026-01-20 12:00:00")
+        self.assertIn("JAN 20, 2026", january.text("TFT"))
+        ## Issue times are never in the future, so day 350 in October
+        ## was last year
+        december = self.alert("3501200", year=2026, yearDay=290)
+        self.assertEqual(december.startTime.year, 2025)
+        ## ... but a clock a day behind the sender still gets this year
+        skewed = self.alert("2911200", year=2026, yearDay=290)
+        self.assertEqual(skewed.startTime.year, 2026)
+
+    def testOffset(self):
+        alert = self.alert("0231829", dtOffset=6 * 3600, tzName="CST")
+        self.assertEqual(str(alert.startTime), "2026-01-23 12:29:00")
+
+    def testNamedZone(self):
+        try:
+            zone = getClock("America/Chicago").zone
+        except Exception:
+            self.skipTest("No zoneinfo data available")
+        winter = self.alert("0231829", dtOffset=None, tzName=None, zone=zone)
+        self.assertEqual(str(winter.startTime), "2026-01-23 12:29:00")
+        self.assertEqual(winter.tzName, "CST")
+        summer = self.alert("1831829", dtOffset=None, tzName=None, zone=zone)
+        self.assertEqual(str(summer.startTime), "2026-07-02 13:29:00")
+        self.assertIn("CDT", summer.text("TRILITHIC"))
+
+    def testClockCached(self):
+        first, second = getClock(-5), getClock(-5)
+        if first.minute == second.minute:
+            self.assertIs(first, second, "Clock Not Cached!")
+
+
+class TestSubscriberIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SubscriberIndex()
+        self.index.subscribe("county", "055079")
+        self.index.subscribe("state", "WI")
+        self.index.subscribe("subdivision", "155079")
+        self.index.subscribe("national", "000000")
+        self.index.subscribe("elsewhere", ["17031", "IL"])
+
+    def testMatch(self):
+        self.assertEqual(
+            self.index.match(["155079"]),
+            {"county", "state", "subdivision", "national"},
+        )
+        self.assertEqual(
+            self.index.match(["255079"]), {"county", "state", "national"}
+        )
+        self.assertEqual(
+            self.index.match(["055000"]),
+            {"county", "state", "subdivision", "national"},
+        )
+        self.assertEqual(len(self.index.match(["000000"])), 5)
+        alert = EAS2Text("ZCZC-WXR-TOR-017031+0030-0012345-SOFTTEST-")
+        self.assertEqual(self.index.match(alert), {"elsewhere", "national"})
+        self.assertEqual(
+            self.index.match(["55079"]), self.index.match(["055079"])
+        )
+        self.assertEqual(self.index.match(EAS2Text("NNNN")), set())
+        self.assertEqual(self.index.match(ParsedAlert("NNNN")), set())
+        self.assertEqual(self.index.match([]), set())
+
+    def testUnsubscribe(self):
+        self.index.unsubscribe("elsewhere", "17031")
+        self.assertEqual(self.index.subscriptions("elsewhere"), {"017000"})
+        self.assertIn("elsewhere", self.index.match(["017031"]))
+        self.index.unsubscribe("elsewhere")
+        self.assertNotIn("elsewhere", self.index)
+        self.assertEqual(self.index.match(["017031"]), {"national"})
+        self.assertEqual(len(self.index), 4)
+
+    def testUnknownCode(self):
+        with self.assertRaises(ValueError):
+            self.index.subscribe("bad", ["055079", "055999"])
+        self.assertNotIn("bad", self.index)
+
+
+class TestBursts(unittest.TestCase):
+    header = "ZCZC-WXR-TOR-055079+0030-0012345-SOFTTEST-"
+
+    def testMajorityVote(self):
+        bursts = [
+            self.header.replace("TOR", "TKR"),
+            self.header,
+            self.header.replace("055079", "055779"),
+        ]
+        self.assertEqual(reconcile(bursts), self.header)
+        self.assertEqual(
+            reconcile([self.header.replace("+", "#"), self.header]),
+            self.header,
+        )
+
+    def testDuplicates(self):
+        other = "ZCZC-WXR-SVR-017031+0030-0012345-SOFTTEST-"
+        headers = [self.header] * 6 + ["NNNN"] * 6 + [other]
+        self.assertEqual(
+            list(reconcileStream(headers)),
+            [self.header, "NNNN", "NNNN", other],
+        )
+        results = list(decodeBursts(headers, timeZone=0))
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[0].alert.evnt, "TOR")
+
+    def testWindow(self):
+        reconciler = BurstReconciler(window=5.0, dedupeWindow=60.0)
+        self.assertEqual(reconciler.feed(self.header, 0.0), [])
+        self.assertEqual(reconciler.feed(self.header, 1.0), [])
+        self.assertEqual(reconciler.feed(self.header, 10.0), [self.header])
+        self.assertEqual(reconciler.flush(10.0), [])
+        self.assertEqual(reconciler.feed(self.header, 100.0), [])
+        self.assertEqual(reconciler.flush(100.0), [self.header])
+        stats = reconciler.stats()
+        self.assertEqual((stats["groups"], stats["duplicates"]), (3, 1))
+
+    def testExpire(self):
+        reconciler = BurstReconciler(window=5.0)
+        self.assertEqual(reconciler.feed(self.header, 0.0), [])
+        self.assertEqual(reconciler.expire(4.0), [])
+        self.assertEqual(reconciler.timeLeft(4.0), 1.0)
+        self.assertEqual(reconciler.expire(6.0), [self.header])
+        self.assertIsNone(reconciler.timeLeft(6.0))
+
+    def testQuietSource(self):
+        ## A lone burst still comes out while the source has nothing new
+        done = threading.Event()
+
+        def receiver():
+            yield self.header
+            done.wait(5)
+
+        started = time.monotonic()
+        stream = reconcileStream(receiver(), window=0.2)
+        self.assertEqual(next(stream), self.header)
+        self.assertLess(time.monotonic() - started, 2)
+        done.set()
+        self.assertEqual(list(stream), [])
+
+
+class TestInstrumentation(unittest.TestCase):
+    def tearDown(self):
+        disableInstrumentation()
+
+    def testDisabled(self):
+        instruments = Instruments()
+        EAS2Text("ZCZC-WXR-TOR-055079+0030-0012345-SOFTTEST-")
+        self.assertEqual(
+            instruments.snapshot(), {"counters": {}, "stages": {}}
+        )
+
+    def testCounters(self):
+        instruments = enableInstrumentation()
+        stages = []
+        instruments.addHook(lambda stage, seconds: stages.append(stage))
+        EAS2Text("ZCZC-WXR-TOR-055079+0030-0012345-SOFTTEST-", mode="TFT")
+        EAS2Text("ZCZC-XXX-QQQ-055079-099998+0030-0012345-SOFTTEST-")
+        with self.assertRaises(InvalidSAME):
+            EAS2Text("ZCZC-WXR-TOR-055079+0075-0012345-SOFTTEST-")
+        snapshot = instruments.snapshot()
+        self.assertEqual(
+            snapshot["counters"],
+            {
+                "decoded": {"TFT": 1, "NONE": 1},
+                "unknown": {"FIPS": 1, "originator": 1, "event": 1},
+                "invalid": {"PURGE": 1},
+            },
+        )
+        self.assertEqual(
+            stages[:6],
+            ["tables", "header", "fips", "times", "codes", "render"],
+        )
+        self.assertEqual(snapshot["stages"]["render"]["count"], 2)
+        with instruments.stage("dispatch"):
+            pass
+        self.assertIn("dispatch", instruments.snapshot()["stages"])
+        instruments.reset()
+        self.assertEqual(instruments.snapshot()["counters"], {})
+
+    def testSharedStages(self):
+        ## A stage added to ParsedAlert is run and timed by both paths
+        ran = []
+
+        class Extended(ParsedAlert):
+            STAGES = ParsedAlert.STAGES + (
+                ("extra", lambda self, stats, clock: ran.append(self.evnt)),
+            )
+
+        Extended("ZCZC-WXR-TOR-055079+0030-0012345-SOFTTEST-")
+        instruments = enableInstrumentation()
+        alert = Extended("ZCZC-WXR-SVR-055079+0030-0012345-SOFTTEST-")
+        self.assertEqual(ran, ["TOR", "SVR"])
+        self.assertEqual(alert.evntText, "a Severe Thunderstorm Warning")
+        self.assertEqual(
+            list(instruments.snapshot()["stages"]),
+            ["tables", "header", "fips", "times", "codes", "extra"],
+        )
+        Extended("NNNN")
+        self.assertEqual(ran, ["TOR", "SVR"])
+
+
+class TestBenchmark(unittest.TestCase):
+    def testCorpus(self):
+        corpus = generateCorpus(500, seed=7)
+        self.assertEqual(corpus, generateCorpus(500, seed=7))
+        self.assertNotEqual(corpus, generateCorpus(500, seed=8))
+        self.assertIn("NNNN", corpus)
+        results = decodeMany(corpus, timeZone=0)
+        errors = [result for result in results if result.error is not None]
+        self.assertTrue(0 < len(errors) < len(corpus) * 0.2)
+        for result in results:
+            if result.alert is not None and result.alert.FIPS:
+                self.assertTrue(1 <= len(result.alert.FIPS) <= 31)
+
+    def testCompare(self):
+        baseline = {"modes": {"NONE": {"decodesPerSec": 1000.0, "p99": 10.0}}}
+        current = {"modes": {"NONE": {"decodesPerSec": 800.0, "p99": 10.5}}}
+        report = {row[0]: row[4] for row in compare(baseline, current)}
+        self.assertEqual(
+            report, {"NONE decodesPerSec": True, "NONE p99": False}
+        )
+
+
+class TestCLI(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.folder.name, "headers.txt")
+        self.output = os.path.join(self.folder.name, "alerts")
+        with open(self.input, "w") as headers:
+            headers.write(
+                "ZCZC-WXR-TOR-055079+0030-0012345-SOFTTEST-\n\n"
+                "ZCZC-WXR-TOR-055079+0075-0012345-SOFTTEST-\nNNNN\n"
+            )
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def testJSONL(self):
+        main([self.input, "-t", "0", "-m", "DASDEC", "-o", self.output, "-q"])
+        with open(self.output) as alerts:
+            records = [AlertRecord.fromJSON(line) for line in alerts]
+        self.assertEqual([record.evnt for record in records], ["TOR", None])
+        self.assertTrue(records[0].EASText.startswith("THE NATIONAL"))
+
+    def testCSV(self):
+        main([self.input, "-f", "csv", "-w", "2", "-o", self.output, "-q"])
+        with open(self.output) as alerts:
+            rows = alerts.read().splitlines()
+        self.assertEqual(len(rows), 3)
+        self.assertTrue(rows[0].startswith("EASData,org,evnt,FIPS"))
+
+
 if __name__ == "__main__":
     unittest.main()